@@ -1,15 +1,23 @@
 from __future__ import annotations
 
 import asyncio
-import base64
-from mimetypes import guess_file_type
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+import hashlib
+import mimetypes
 from pathlib import Path
+import time
 
 import openai
 import voluptuous as vol
+from openai.lib.streaming import AsyncAssistantEventHandler
+from openai.types.beta.threads.message_content_part_param import (
+    MessageContentPartParam,
+)
+from openai.types.beta.threads.message_create_params import Attachment
 from openai.types.images_response import ImagesResponse
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import CONF_API_KEY, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError, ServiceValidationError
@@ -21,8 +29,12 @@ from .const import (
     DOMAIN,
     LOGGER,
     CONF_ASSISTANT_ID,
+    CONF_CACHE_TTL,
     CONF_PROMPT,
     CONF_FILENAMES,
+    RECOMMENDED_CACHE_TTL,
+    RUN_ACTIVE_STATUSES,
+    RUN_TIMEOUT,
 )
 
 SERVICE_GENERATE_IMAGE = "generate_image"
@@ -31,18 +43,103 @@ SERVICE_GENERATE_CONTENT = "generate_content"
 PLATFORMS = (Platform.CONVERSATION,)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+GENERATE_CONTENT_SCHEMA = vol.Schema({
+    vol.Required("config_entry"): selector.ConfigEntrySelector({
+        "integration": DOMAIN
+    }),
+    vol.Required(CONF_PROMPT): cv.string,
+    vol.Optional(CONF_FILENAMES, default=[]): vol.All(cv.ensure_list, [cv.string])
+})
+GENERATE_IMAGE_SCHEMA = vol.Schema({
+    vol.Required("config_entry"): selector.ConfigEntrySelector({
+        "integration": DOMAIN
+    }),
+    vol.Required(CONF_PROMPT): cv.string,
+    vol.Optional("size", default="1024x1024"): vol.In(
+        frozenset({"1024x1024", "1024x1792", "1792x1024"})
+    ),
+    vol.Optional("quality", default="standard"): vol.In(frozenset({"standard", "hd"})),
+    vol.Optional("style", default="vivid"): vol.In(frozenset({"vivid", "natural"}))
+})
+
+CACHE_MAX_ENTRIES = 128
+# Generated image URLs expire after about an hour
+IMAGE_CACHE_MAX_TTL = 3000
+
+
+@lru_cache(maxsize=256)
+def _mime_for(suffix: str) -> str:
+    """Return the MIME type for a file suffix."""
+    return mimetypes.guess_type("x" + suffix)[0] or "application/octet-stream"
+
+
+async def _async_delete_thread(
+    client: openai.AsyncClient, thread_id: str, run_id: str | None
+) -> None:
+    """Cancel a run left active on a one-off thread and delete the thread."""
+    if run_id is not None:
+        try:
+            await client.beta.threads.runs.cancel(thread_id=thread_id, run_id=run_id)
+        except openai.OpenAIError as err:
+            LOGGER.debug("Could not cancel run %s: %s", run_id, err)
+    try:
+        await client.beta.threads.delete(thread_id)
+    except openai.OpenAIError as err:
+        LOGGER.debug("Could not delete thread %s: %s", thread_id, err)
+
 
-def encode_file(file_path: str) -> tuple[str, str]:
-    """Return base64 version of file contents."""
-    mime_type, _ = guess_file_type(file_path)
-    if mime_type is None:
-        mime_type = "application/octet-stream"
-    with open(file_path, "rb") as file:
-        return mime_type, base64.b64encode(file.read()).decode("utf-8")
+async def _async_delete_file(client: openai.AsyncClient, file_id: str) -> None:
+    """Delete an uploaded attachment once its run is over."""
+    try:
+        await client.files.delete(file_id)
+    except openai.OpenAIError as err:
+        LOGGER.debug("Could not delete file %s: %s", file_id, err)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the integration and register services."""
+    response_cache: dict[str, tuple[float, ServiceResponse]] = {}
+    # Locks only live while a call for their key is in flight
+    cache_locks: dict[str, asyncio.Lock] = {}
+    cache_lock_users: dict[str, int] = {}
+
+    async def async_cached(
+        entry: ConfigEntry,
+        key: str,
+        fetch: Callable[[], Awaitable[ServiceResponse]],
+        max_ttl: float | None = None,
+    ) -> ServiceResponse:
+        """Return a cached service response or fetch and store a fresh one."""
+        ttl = entry.options.get(CONF_CACHE_TTL, RECOMMENDED_CACHE_TTL)
+        if max_ttl is not None:
+            ttl = min(ttl, max_ttl)
+        if not ttl:
+            return await fetch()
+
+        key = hashlib.blake2b(f"{entry.entry_id}|{key}".encode()).hexdigest()
+        lock = cache_locks.setdefault(key, asyncio.Lock())
+        cache_lock_users[key] = cache_lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                cached = response_cache.pop(key, None)
+                if cached is not None and time.monotonic() - cached[0] < ttl:
+                    # Re-insert so the most recently used entries are evicted last
+                    response_cache[key] = cached
+                    return cached[1]
+
+                result = await fetch()
+                response_cache[key] = (time.monotonic(), result)
+                if (excess := len(response_cache) - CACHE_MAX_ENTRIES) > 0:
+                    # Entries with a call in flight are skipped, their lock is held
+                    evictable = [k for k in response_cache if k not in cache_locks]
+                    for evicted in evictable[:excess]:
+                        del response_cache[evicted]
+                return result
+        finally:
+            cache_lock_users[key] -= 1
+            if not cache_lock_users[key]:
+                del cache_lock_users[key]
+                del cache_locks[key]
 
     async def render_image(call: ServiceCall) -> ServiceResponse:
         """Generate an image from prompt using DALL-E."""
@@ -58,23 +155,33 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
         client: openai.AsyncClient = entry.runtime_data
 
-        try:
-            response: ImagesResponse = await client.images.generate(
-                model="dall-e-3",
-                prompt=call.data[CONF_PROMPT],
-                size=call.data["size"],
-                quality=call.data["quality"],
-                style=call.data["style"],
-                response_format="url",
-                n=1,
-            )
-        except openai.OpenAIError as err:
-            raise HomeAssistantError(f"Error generating image: {err}") from err
-
-        if not response.data or not response.data[0].url:
-            raise HomeAssistantError("No image returned")
-
-        return response.data[0].model_dump(exclude={"b64_json"})
+        async def generate() -> ServiceResponse:
+            """Request a new image from the API."""
+            try:
+                response: ImagesResponse = await client.images.generate(
+                    model="dall-e-3",
+                    prompt=call.data[CONF_PROMPT],
+                    size=call.data["size"],
+                    quality=call.data["quality"],
+                    style=call.data["style"],
+                    response_format="url",
+                    n=1,
+                )
+            except openai.OpenAIError as err:
+                raise HomeAssistantError(f"Error generating image: {err}") from err
+
+            if not response.data or not response.data[0].url:
+                raise HomeAssistantError("No image returned")
+
+            return response.data[0].model_dump(exclude={"b64_json"})
+
+        return await async_cached(
+            entry,
+            f"image|{call.data[CONF_PROMPT]}|{call.data['size']}"
+            f"|{call.data['quality']}|{call.data['style']}",
+            generate,
+            max_ttl=IMAGE_CACHE_MAX_TTL,
+        )
 
     async def send_prompt(call: ServiceCall) -> ServiceResponse:
         """Send a prompt to OpenAI Assistant and return its reply."""
@@ -94,52 +201,129 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         if not assistant_id:
             raise HomeAssistantError("Missing assistant_id in configuration")
 
-        try:
-            thread = await client.beta.threads.create()
-            await client.beta.threads.messages.create(
-                thread_id=thread.id,
-                role="user",
-                content=call.data[CONF_PROMPT]
-            )
-
-            run = await client.beta.threads.runs.create(
-                thread_id=thread.id,
-                assistant_id=assistant_id,
-            )
-
-            while True:
-                run = await client.beta.threads.runs.retrieve(thread_id=thread.id, run_id=run.id)
-                if run.status == "completed":
-                    break
-                elif run.status in ["failed", "cancelled", "expired"]:
-                    raise HomeAssistantError(f"Run failed with status: {run.status}")
-                await asyncio.sleep(1)
-
-            messages = await client.beta.threads.messages.list(thread_id=thread.id)
-            last = next((m for m in reversed(messages.data) if m.role == "assistant"), None)
-
-            if not last or not last.content:
-                raise HomeAssistantError("No assistant response")
-
-            return {
-                "text": "\n".join(part.text.value for part in last.content if part.type == "text")
-            }
-
-        except Exception as err:
-            raise HomeAssistantError(f"Error using Assistant API: {err}") from err
+        filenames: list[str] = call.data[CONF_FILENAMES]
+        for filename in filenames:
+            if not hass.config.is_allowed_path(filename):
+                raise HomeAssistantError(
+                    f"Cannot read `{filename}`, no access to path; "
+                    "`allowlist_external_dirs` may need to be adjusted in "
+                    "`configuration.yaml`"
+                )
+
+        # Images go into the message for vision, other files to file_search
+        is_image = [
+            _mime_for(Path(filename).suffix).startswith("image/")
+            for filename in filenames
+        ]
+
+        async def generate() -> ServiceResponse:
+            """Run the prompt on a fresh assistant thread."""
+            file_ids: list[str] = []
+            thread_id: str | None = None
+            stream: AsyncAssistantEventHandler | None = None
+            try:
+                content: str | list[MessageContentPartParam] = call.data[CONF_PROMPT]
+                attachments: list[Attachment] = []
+                if filenames:
+                    # The SDK reads path uploads off the event loop, so they run concurrently
+                    uploads = await asyncio.gather(
+                        *(
+                            client.files.create(
+                                file=Path(filename),
+                                purpose="vision" if image else "assistants",
+                            )
+                            for filename, image in zip(filenames, is_image)
+                        ),
+                        return_exceptions=True,
+                    )
+                    file_ids = [f.id for f in uploads if not isinstance(f, BaseException)]
+                    for upload in uploads:
+                        if isinstance(upload, BaseException):
+                            raise upload
+
+                    content = [{"type": "text", "text": call.data[CONF_PROMPT]}]
+                    for upload, image in zip(uploads, is_image):
+                        if image:
+                            content.append(
+                                {"type": "image_file", "image_file": {"file_id": upload.id}}
+                            )
+                        else:
+                            attachments.append(
+                                {"file_id": upload.id, "tools": [{"type": "file_search"}]}
+                            )
+
+                thread = await client.beta.threads.create()
+                thread_id = thread.id
+                await client.beta.threads.messages.create(
+                    thread_id=thread_id,
+                    role="user",
+                    content=content,
+                    attachments=attachments,
+                )
+
+                # Completion is pushed over the run's event stream, no polling
+                try:
+                    async with (
+                        asyncio.timeout(RUN_TIMEOUT),
+                        client.beta.threads.runs.stream(
+                            thread_id=thread_id,
+                            assistant_id=assistant_id,
+                        ) as stream,
+                    ):
+                        await stream.until_done()
+                except TimeoutError as err:
+                    raise HomeAssistantError("run timed out") from err
+
+                run = stream.current_run
+                if run is None or run.status != "completed":
+                    status = run.status if run else "unknown"
+                    raise HomeAssistantError(f"Run failed with status: {status}")
+
+                last = stream.current_message_snapshot
+
+                if not last or last.role != "assistant" or not last.content:
+                    raise HomeAssistantError("No assistant response")
+
+                parts = last.content
+                return {
+                    "text": "\n".join([part.text.value for part in parts if part.type == "text"])
+                }
+
+            except openai.OpenAIError as err:
+                raise HomeAssistantError(f"Error using Assistant API: {err}") from err
+            except OSError as err:
+                raise HomeAssistantError(f"Error reading file: {err}") from err
+            finally:
+                # The thread is single use, cancel a run still active on it and drop it
+                if thread_id is not None:
+                    run = stream.current_run if stream is not None else None
+                    active = run is not None and run.status in RUN_ACTIVE_STATUSES
+                    hass.async_create_background_task(
+                        _async_delete_thread(
+                            client, thread_id, run.id if active else None
+                        ),
+                        f"{DOMAIN} delete thread {thread_id}",
+                    )
+                for file_id in file_ids:
+                    hass.async_create_background_task(
+                        _async_delete_file(client, file_id),
+                        f"{DOMAIN} delete file {file_id}",
+                    )
+
+        if filenames:
+            # File contents may change between calls, never serve them from cache
+            return await generate()
+
+        return await async_cached(
+            entry, f"text|{assistant_id}|{call.data[CONF_PROMPT]}", generate
+        )
 
     # Register service: generate content
     hass.services.async_register(
         DOMAIN,
         SERVICE_GENERATE_CONTENT,
         send_prompt,
-        schema=vol.Schema({
-            vol.Required("config_entry"): selector.ConfigEntrySelector({
-                "integration": DOMAIN
-            }),
-            vol.Required(CONF_PROMPT): cv.string,
-            vol.Optional(CONF_FILENAMES, default=[]): vol.All(cv.ensure_list, [cv.string])
-        }),
+        schema=GENERATE_CONTENT_SCHEMA,
         supports_response=SupportsResponse.ONLY
     )
 
@@ -148,15 +332,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         DOMAIN,
         SERVICE_GENERATE_IMAGE,
         render_image,
-        schema=vol.Schema({
-            vol.Required("config_entry"): selector.ConfigEntrySelector({
-                "integration": DOMAIN
-            }),
-            vol.Required(CONF_PROMPT): cv.string,
-            vol.Optional("size", default="1024x1024"): vol.In(("1024x1024", "1024x1792", "1792x1024")),
-            vol.Optional("quality", default="standard"): vol.In(("standard", "hd")),
-            vol.Optional("style", default="vivid"): vol.In(("vivid", "natural"))
-        }),
+        schema=GENERATE_IMAGE_SCHEMA,
         supports_response=SupportsResponse.ONLY
     )
 
@@ -165,18 +341,23 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up integration from a config entry."""
-    client = openai.AsyncOpenAI(
-        api_key=entry.data[CONF_API_KEY],
-        http_client=get_async_client(hass)
-    )
+    # Entries sharing an API key share one client and its connection pool
+    clients: dict[str, openai.AsyncOpenAI] = hass.data.setdefault(DOMAIN, {})
+    api_key = entry.data[CONF_API_KEY]
+    if (client := clients.get(api_key)) is None:
+        client = clients[api_key] = openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=get_async_client(hass)
+        )
 
     try:
-        _ = await hass.async_add_executor_job(client.platform_headers)
-        await hass.async_add_executor_job(client.with_options(timeout=10.0).models.list)
+        await client.with_options(timeout=10.0).models.list()
     except openai.AuthenticationError as err:
         LOGGER.error("Invalid API key: %s", err)
+        _release_client(hass, entry)
         return False
     except openai.OpenAIError as err:
+        _release_client(hass, entry)
         raise ConfigEntryNotReady(err) from err
 
     entry.runtime_data = client
@@ -189,4 +370,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload the config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
\ No newline at end of file
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        _release_client(hass, entry)
+    return unload_ok
+
+
+def _release_client(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the entry's client unless another loaded entry shares its API key."""
+    api_key = entry.data[CONF_API_KEY]
+    if not any(
+        other.entry_id != entry.entry_id
+        and other.state is ConfigEntryState.LOADED
+        and other.data[CONF_API_KEY] == api_key
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        hass.data.get(DOMAIN, {}).pop(api_key, None)
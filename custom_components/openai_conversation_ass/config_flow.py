@@ -40,6 +40,7 @@ from homeassistant.helpers.selector import (
 from homeassistant.helpers.typing import VolDictType
 
 from .const import (
+    CONF_CACHE_TTL,
     CONF_CHAT_MODEL,
     CONF_MAX_TOKENS,
     CONF_PROMPT,
@@ -55,6 +56,7 @@ from .const import (
     CONF_WEB_SEARCH_TIMEZONE,
     CONF_WEB_SEARCH_USER_LOCATION,
     DOMAIN,
+    RECOMMENDED_CACHE_TTL,
     RECOMMENDED_CHAT_MODEL,
     RECOMMENDED_MAX_TOKENS,
     RECOMMENDED_REASONING_EFFORT,
@@ -91,7 +93,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> None:
     client = openai.AsyncOpenAI(
         api_key=data[CONF_API_KEY], http_client=get_async_client(hass)
     )
-    await hass.async_add_executor_job(client.with_options(timeout=10.0).models.list)
+    await client.with_options(timeout=10.0).models.list()
 
 
 class OpenAIConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -182,6 +184,9 @@ class OpenAIOptionsFlow(OptionsFlow):
                         CONF_PROMPT, llm.DEFAULT_INSTRUCTIONS_PROMPT
                     ),
                     CONF_LLM_HASS_API: user_input.get(CONF_LLM_HASS_API),
+                    CONF_CACHE_TTL: user_input.get(
+                        CONF_CACHE_TTL, RECOMMENDED_CACHE_TTL
+                    ),
                 }
 
         schema = openai_config_option_schema(self.hass, options)
@@ -274,6 +279,13 @@ def openai_config_option_schema(
             CONF_LLM_HASS_API,
             description={"suggested_value": suggested_llm_apis},
         ): SelectSelector(SelectSelectorConfig(options=hass_apis, multiple=True)),
+        vol.Optional(
+            CONF_CACHE_TTL,
+            description={"suggested_value": options.get(CONF_CACHE_TTL)},
+            default=RECOMMENDED_CACHE_TTL,
+        ): NumberSelector(
+            NumberSelectorConfig(min=0, max=86400, step=1, unit_of_measurement="s")
+        ),
         vol.Required(
             CONF_RECOMMENDED, default=options.get(CONF_RECOMMENDED, False)
         ): bool,
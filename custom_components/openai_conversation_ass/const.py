@@ -5,6 +5,7 @@ import logging
 DOMAIN = "openai_conversation_ass"
 LOGGER: logging.Logger = logging.getLogger(__package__)
 
+CONF_CACHE_TTL = "cache_ttl"
 CONF_CHAT_MODEL = "chat_model"
 CONF_FILENAMES = "filenames"
 CONF_MAX_TOKENS = "max_tokens"
@@ -21,6 +22,7 @@ CONF_WEB_SEARCH_CITY = "city"
 CONF_WEB_SEARCH_REGION = "region"
 CONF_WEB_SEARCH_COUNTRY = "country"
 CONF_WEB_SEARCH_TIMEZONE = "timezone"
+RECOMMENDED_CACHE_TTL = 0
 RECOMMENDED_CHAT_MODEL = "gpt-4o-mini"
 RECOMMENDED_MAX_TOKENS = 150
 RECOMMENDED_REASONING_EFFORT = "low"
@@ -29,6 +31,8 @@ RECOMMENDED_TOP_P = 1.0
 RECOMMENDED_WEB_SEARCH = False
 RECOMMENDED_WEB_SEARCH_CONTEXT_SIZE = "medium"
 RECOMMENDED_WEB_SEARCH_USER_LOCATION = False
+RUN_ACTIVE_STATUSES = ("queued", "in_progress", "requires_action")
+RUN_TIMEOUT = 120
 
 UNSUPPORTED_MODELS: list[str] = [
     "o1-mini",
@@ -1,10 +1,12 @@
 import asyncio
-from collections.abc import AsyncGenerator, Callable
-import json
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+import itertools
 from typing import Any, Literal, cast
 
 import openai
 from openai._streaming import AsyncStream
+from openai.lib.streaming import AsyncAssistantEventHandler
+from openai.types.beta import AssistantStreamEvent
 from openai.types.responses import (
     EasyInputMessageParam,
     FunctionToolParam,
@@ -39,6 +41,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, intent, llm
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.json import json_dumps
 
 from .const import (
     CONF_ASSISTANT_ID,
@@ -53,8 +56,14 @@ from .const import (
     DOMAIN,
     LOGGER,
     RECOMMENDED_WEB_SEARCH_CONTEXT_SIZE,
+    RUN_ACTIVE_STATUSES,
+    RUN_TIMEOUT,
 )
 
+# Conversations that keep their assistant thread for follow-up turns
+MAX_THREADS = 64
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -64,6 +73,13 @@ async def async_setup_entry(
     async_add_entities([agent])
 
 
+def _dump_json(value: Any) -> str:
+    """Serialize tool arguments or results, skipping the encoder when empty."""
+    if value is None or value == {}:
+        return "{}"
+    return json_dumps(value)
+
+
 def _convert_content_to_param(content: conversation.Content) -> ResponseInputParam:
     messages: ResponseInputParam = []
     if isinstance(content, conversation.ToolResultContent):
@@ -71,7 +87,7 @@ def _convert_content_to_param(content: conversation.Content) -> ResponseInputPar
             FunctionCallOutput(
                 type="function_call_output",
                 call_id=content.tool_call_id,
-                output=json.dumps(content.tool_result),
+                output=_dump_json(content.tool_result),
             )
         ]
 
@@ -88,7 +104,7 @@ def _convert_content_to_param(content: conversation.Content) -> ResponseInputPar
             ResponseFunctionToolCallParam(
                 type="function_call",
                 name=tool_call.tool_name,
-                arguments=json.dumps(tool_call.tool_args),
+                arguments=_dump_json(tool_call.tool_args),
                 call_id=tool_call.id,
             )
             for tool_call in content.tool_calls
@@ -96,6 +112,56 @@ def _convert_content_to_param(content: conversation.Content) -> ResponseInputPar
     return messages
 
 
+def _merge_thread_messages(
+    messages: ResponseInputParam,
+) -> list[tuple[Literal["user", "assistant"], str]]:
+    """Collapse adjacent messages of the same role into single thread messages.
+
+    Assistants threads only hold user and assistant messages, so developer
+    instructions are folded into the user turn and tool items are skipped.
+    """
+    merged: list[tuple[Literal["user", "assistant"], list[str]]] = []
+    for msg in messages:
+        if msg.get("type") != "message":
+            continue
+        role: Literal["user", "assistant"] = (
+            "assistant" if msg["role"] == "assistant" else "user"
+        )
+        if merged and merged[-1][0] == role:
+            merged[-1][1].append(msg["content"])
+        else:
+            merged.append((role, [msg["content"]]))
+    return [(role, "\n\n".join(parts)) for role, parts in merged]
+
+
+async def _transform_stream(
+    stream: AsyncIterator[AssistantStreamEvent],
+) -> AsyncGenerator[conversation.AssistantContentDeltaDict]:
+    """Transform an Assistants run event stream into HA format."""
+    async for event in stream:
+        LOGGER.debug("Received event: %s", event.event)
+
+        if event.event == "thread.message.created":
+            yield {"role": "assistant"}
+        elif event.event == "thread.message.delta":
+            for part in event.data.delta.content or ():
+                if part.type == "text" and part.text and part.text.value:
+                    yield {"content": part.text.value}
+        elif event.event == "thread.run.requires_action":
+            raise HomeAssistantError(
+                "Assistant requested tool calls, which are not supported"
+            )
+        elif event.event in (
+            "thread.run.failed",
+            "thread.run.cancelled",
+            "thread.run.expired",
+            "thread.run.incomplete",
+        ):
+            raise HomeAssistantError(f"Run failed with status: {event.data.status}")
+        elif event.event == "error":
+            raise HomeAssistantError(f"Run error: {event.data.message}")
+
+
 class OpenAIConversationEntity(
     conversation.ConversationEntity, conversation.AbstractConversationAgent
 ):
@@ -105,6 +171,9 @@ class OpenAIConversationEntity(
 
     def __init__(self, entry: ConfigEntry) -> None:
         self.entry = entry
+        self._threads: dict[str, str] = {}
+        self._turn_locks: dict[str, asyncio.Lock] = {}
+        self._turn_lock_users: dict[str, int] = {}
         self._attr_unique_id = entry.entry_id
         self._attr_device_info = dr.DeviceInfo(
             identifiers={(DOMAIN, entry.entry_id)},
@@ -134,6 +203,8 @@ class OpenAIConversationEntity(
 
     async def async_will_remove_from_hass(self) -> None:
         conversation.async_unset_agent(self.hass, self.entry)
+        for conversation_id in list(self._threads):
+            self._forget_thread(conversation_id)
         await super().async_will_remove_from_hass()
 
     async def _async_handle_message(
@@ -164,66 +235,116 @@ class OpenAIConversationEntity(
             continue_conversation=chat_log.continue_conversation,
         )
 
-    async def async_process(
-            self, user_input: conversation.ConversationInput
-    ) -> conversation.ConversationResult:
-        """Process user input."""
-        chat_log = conversation.ChatLog(
-            user_input.conversation_id,
-            user_input.language,
+    async def _async_handle_chat_log(self, chat_log: conversation.ChatLog) -> None:
+        # Turns on one conversation share a thread and must not overlap
+        conversation_id = chat_log.conversation_id
+        lock = self._turn_locks.setdefault(conversation_id, asyncio.Lock())
+        self._turn_lock_users[conversation_id] = (
+            self._turn_lock_users.get(conversation_id, 0) + 1
         )
-        chat_log.async_add_user_content(user_input.text)
-
-        return await self._async_handle_message(user_input, chat_log)
+        try:
+            async with lock:
+                await self._async_handle_turn(chat_log)
+        finally:
+            self._turn_lock_users[conversation_id] -= 1
+            if not self._turn_lock_users[conversation_id]:
+                del self._turn_lock_users[conversation_id]
+                del self._turn_locks[conversation_id]
 
-    async def _async_handle_chat_log(self, chat_log: conversation.ChatLog) -> None:
+    async def _async_handle_turn(self, chat_log: conversation.ChatLog) -> None:
         client = self.entry.runtime_data
         options = self.entry.options
+        conversation_id = chat_log.conversation_id
 
-        messages_content = [
-            m
-            for content in chat_log.content
-            for m in _convert_content_to_param(content)
-        ]
+        # A known thread already holds the history, only the new turn is posted
+        thread_id = self._threads.pop(conversation_id, None)
+        if thread_id is not None:
+            self._threads[conversation_id] = thread_id
+        contents = chat_log.content if thread_id is None else chat_log.content[-1:]
+        messages_content = list(
+            itertools.chain.from_iterable(
+                _convert_content_to_param(content) for content in contents
+            )
+        )
 
         assistant_id = self.entry.data.get(CONF_ASSISTANT_ID)
         if not assistant_id:
             raise HomeAssistantError("Missing assistant_id in configuration")
 
+        stream: AsyncAssistantEventHandler | None = None
         try:
-            thread = await client.beta.threads.create()
-            for msg in messages_content:
-                if isinstance(msg, list):
-                    for inner in msg:
-                        await client.beta.threads.messages.create(thread_id=thread.id, role="user", content=inner["content"])
-                else:
-                    await client.beta.threads.messages.create(thread_id=thread.id, role="user", content=msg["content"])
-
-            run = await client.beta.threads.runs.create(
-                thread_id=thread.id,
-                assistant_id=assistant_id,
-            )
+            if thread_id is None:
+                thread = await client.beta.threads.create()
+                thread_id = self._threads[conversation_id] = thread.id
+                if (excess := len(self._threads) - MAX_THREADS) > 0:
+                    # Conversations with a turn in progress are skipped
+                    evictable = [c for c in self._threads if c not in self._turn_locks]
+                    for evicted in evictable[:excess]:
+                        self._forget_thread(evicted)
+
+            create_message = client.beta.threads.messages.create
+            for role, content in _merge_thread_messages(messages_content):
+                await create_message(thread_id=thread_id, role=role, content=content)
 
-            while True:
-                run = await client.beta.threads.runs.retrieve(thread_id=thread.id, run_id=run.id)
-                if run.status == "completed":
-                    break
-                elif run.status in ["failed", "cancelled", "expired"]:
-                    raise HomeAssistantError(f"Run failed with status: {run.status}")
-                await asyncio.sleep(1)
-
-            messages = await client.beta.threads.messages.list(thread_id=thread.id)
-            for msg in reversed(messages.data):
-                if msg.role == "assistant":
-                    response_content = "".join(
-                        part.text.value for part in msg.content if part.type == "text"
-                    )
-                    chat_log.async_add_ai_message(response_content)
-                    break
+            async with (
+                asyncio.timeout(RUN_TIMEOUT),
+                client.beta.threads.runs.stream(
+                    thread_id=thread_id,
+                    assistant_id=assistant_id,
+                ) as stream,
+            ):
+                async for _ in chat_log.async_add_delta_content_stream(
+                    self.entity_id, _transform_stream(stream)
+                ):
+                    pass
 
+            if type(chat_log.content[-1]) is not conversation.AssistantContent:
+                raise HomeAssistantError("No assistant response")
+
+        except TimeoutError as err:
+            self._forget_thread(conversation_id, stream)
+            raise HomeAssistantError("run timed out") from err
         except openai.OpenAIError as err:
+            self._forget_thread(conversation_id, stream)
             LOGGER.error("Assistant API error: %s", err)
             raise HomeAssistantError("Assistant API error") from err
+        except (HomeAssistantError, asyncio.CancelledError):
+            self._forget_thread(conversation_id, stream)
+            raise
+
+    def _forget_thread(
+        self,
+        conversation_id: str,
+        stream: AsyncAssistantEventHandler | None = None,
+    ) -> None:
+        """Drop a conversation's thread and delete it from OpenAI in the background.
+
+        A run still active on the stream is cancelled first because it would
+        otherwise block the thread until it expires.
+        """
+        if (thread_id := self._threads.pop(conversation_id, None)) is None:
+            return
+        run = stream.current_run if stream is not None else None
+        run_id = (
+            run.id if run is not None and run.status in RUN_ACTIVE_STATUSES else None
+        )
+        # Not tied to the entry, so deletes scheduled while unloading still run
+        self.hass.async_create_background_task(
+            self._async_delete_thread(thread_id, run_id),
+            f"{DOMAIN} delete thread {thread_id}",
+        )
+
+    async def _async_delete_thread(self, thread_id: str, run_id: str | None) -> None:
+        client = self.entry.runtime_data
+        if run_id is not None:
+            try:
+                await client.beta.threads.runs.cancel(thread_id=thread_id, run_id=run_id)
+            except openai.OpenAIError as err:
+                LOGGER.debug("Could not cancel run %s: %s", run_id, err)
+        try:
+            await client.beta.threads.delete(thread_id)
+        except openai.OpenAIError as err:
+            LOGGER.debug("Could not delete thread %s: %s", thread_id, err)
 
     async def _async_entry_update_listener(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file